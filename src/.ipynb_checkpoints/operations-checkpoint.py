@@ -1,27 +1,218 @@
+import operator
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Nullable string dtype used for text operations; Arrow-backed when available
+_STRING_DTYPE = 'string[pyarrow]' if pa is not None else 'string'
+
+_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+_ISO_DATE = '%Y-%m-%d'
+
+# Default for arguments where None is itself a valid value
+_MISSING = object()
+
+# Row count above which numeric comparisons use the parallel numba kernels
+_NUMBA_MIN_ROWS = 100_000
+
+# Only 64-bit arrays, where numba's promotion of the scalar matches numpy's;
+# for narrower floats numpy casts the value down to the array dtype first
+_NUMBA_DTYPES = (np.dtype('int64'), np.dtype('uint64'), np.dtype('float64'))
+
+_TEXT_METHODS = {
+    'lower': 'lower',
+    'upper': 'upper',
+    'title': 'title',
+    'trim': 'strip',
+    'capitalize': 'capitalize',
+}
+
+
+def _with_column(df, column, values):
+    # Shallow copy shares the untouched columns with the input frame;
+    # only the replaced column is newly allocated
+    result = df.copy(deep=False)
+    result[column] = values
+    return result
+
+
+def _formats_per_row(df, column):
+    # Casting to text formats each value on its own for these dtypes;
+    # datetime-like columns pick one precision for the whole column.
+    # A missing column has to raise before any later filter runs
+    if column not in df.columns:
+        return False
+    dtype = df[column].dtype
+    return pd.api.types.is_string_dtype(dtype) or (
+        isinstance(dtype, np.dtype) and dtype.kind in 'biufcO'
+    )
+
+
+def _replace_arrow_strings(column, mapping):
+    # Look every value up in the mapping keys with one Arrow kernel call and
+    # take the replacement where it matched
+    values = pa.array(column)
+    positions = pc.index_in(values, value_set=pa.array(list(mapping), pa.string()))
+    replacements = pc.take(pa.array(list(mapping.values()), pa.string()), positions)
+    replaced = pc.if_else(pc.is_null(positions), values, replacements)
+    # Rebuild with the column's own array type so e.g. string[pyarrow_numpy]
+    # keeps its NaN missing values
+    return pd.Series(type(column.array)(replaced), index=column.index, name=column.name)
+
+
+def _packed_row_key(df, columns):
+    # Pack bool and small integer columns into one uint64 per row so
+    # duplicates can be found with a single hash pass instead of hashing
+    # tuples of values. Returns None when the columns don't fit in 64 bits.
+    if not df.columns.is_unique:
+        return None
+    
+    widths = []
+    for column in columns:
+        dtype = df[column].dtype
+        if dtype == np.bool_:
+            widths.append(1)
+        elif isinstance(dtype, np.dtype) and dtype.kind in 'iu' and dtype.itemsize <= 4:
+            widths.append(dtype.itemsize * 8)
+        elif isinstance(dtype, pd.CategoricalDtype):
+            # Codes are shifted by one so missing (-1) packs as zero
+            widths.append(max(len(dtype.categories).bit_length(), 1))
+        else:
+            return None
+    
+    if not widths or sum(widths) > 64:
+        return None
+    
+    key = np.zeros(len(df), dtype=np.uint64)
+    for column, width in zip(columns, widths):
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            bits = (values.cat.codes.to_numpy().astype(np.int64) + 1).astype(np.uint64)
+        else:
+            # Reinterpret the bits as unsigned so negative values pack cleanly
+            bits = values.to_numpy().view(f'uint{max(width, 8)}').astype(np.uint64)
+        key = (key << np.uint64(width)) | bits
+    return key
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _mask_eq(values, value):
+        out = np.empty(values.size, np.bool_)
+        for i in prange(values.size):
+            out[i] = values[i] == value
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _mask_ne(values, value):
+        out = np.empty(values.size, np.bool_)
+        for i in prange(values.size):
+            out[i] = values[i] != value
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _mask_gt(values, value):
+        out = np.empty(values.size, np.bool_)
+        for i in prange(values.size):
+            out[i] = values[i] > value
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _mask_lt(values, value):
+        out = np.empty(values.size, np.bool_)
+        for i in prange(values.size):
+            out[i] = values[i] < value
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _mask_ge(values, value):
+        out = np.empty(values.size, np.bool_)
+        for i in prange(values.size):
+            out[i] = values[i] >= value
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _mask_le(values, value):
+        out = np.empty(values.size, np.bool_)
+        for i in prange(values.size):
+            out[i] = values[i] <= value
+        return out
+
+    _NUMBA_KERNELS = {
+        '==': _mask_eq,
+        '!=': _mask_ne,
+        '>': _mask_gt,
+        '<': _mask_lt,
+        '>=': _mask_ge,
+        '<=': _mask_le,
+    }
+else:
+    _NUMBA_KERNELS = {}
+
+
+def _contains_mask(column, needle):
+    if pa is not None and pd.api.types.is_string_dtype(column.dtype):
+        try:
+            values = pa.array(column, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object column; fall back to matching its text form
+            values = None
+        
+        if values is not None:
+            # Substring search runs in Arrow's C++ kernel; missing values
+            # never match
+            matched = pc.match_substring(values, needle).fill_null(False)
+            return matched.to_numpy(zero_copy_only=False)
+    
+    matched = column.astype(str).str.contains(needle, regex=False).to_numpy(dtype=bool)
+    return matched & column.notna().to_numpy()
+
 
 class RemoveDuplicates:
     def __init__(self, columns=None, keep='first'):
+        valid_keeps = ['first', 'last', False]
+        if keep not in valid_keeps:
+            raise ValueError(f"Keep must be one of: {valid_keeps}")
+        
         self.columns = columns
         self.keep = keep
     
     def apply(self, df):
-        try:
-            # Make a copy to avoid modifying original
-            result = df.copy()
-            
-            # Drop duplicates
-            result = result.drop_duplicates(
-                subset=self.columns, 
-                keep=self.keep
-            )
-            
-            return result
-        except Exception as e:
-            raise ValueError(f"Remove duplicates failed: {str(e)}")
+        if self.columns is None:
+            columns = list(df.columns)
+        elif pd.api.types.is_list_like(self.columns):
+            columns = list(self.columns)
+        else:
+            columns = [self.columns]
+        
+        key = _packed_row_key(df, columns)
+        if key is not None:
+            duplicated = pd.Series(key).duplicated(keep=self.keep)
+        else:
+            duplicated = df.duplicated(subset=self.columns, keep=self.keep)
+        
+        # iloc with a boolean ndarray avoids index alignment
+        return df.iloc[~duplicated.to_numpy()]
 
 
 class FilterRows:
@@ -33,73 +224,107 @@ class FilterRows:
         self.column = column
         self.operator = operator
         self.value = value
+        self._compare = _COMPARISONS.get(operator)
+        # The numba kernels are typed for plain numeric scalars only
+        self._kernel = None
+        if isinstance(value, (float, np.integer, np.floating)) or (
+            isinstance(value, int) and not isinstance(value, bool) and -2**63 <= value < 2**63
+        ):
+            self._kernel = _NUMBA_KERNELS.get(operator)
+        self._needle = str(value)
+    
+    def _compute_mask(self, df):
+        column = df[self.column]
+        
+        if self.operator == 'contains':
+            return _contains_mask(column, self._needle)
+        elif self.operator == 'in':
+            mask = column.isin(self.value)
+        elif isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biuf':
+            # Compare the raw numpy array, skipping pandas' Series wrapping
+            values = column.to_numpy()
+            if (self._kernel is not None and values.dtype in _NUMBA_DTYPES
+                    and len(values) > _NUMBA_MIN_ROWS):
+                return self._kernel(values, self.value)
+            return self._compare(values, self.value)
+        else:
+            mask = self._compare(column, self.value)
+        
+        return mask.to_numpy(dtype=bool, na_value=False)
     
     def apply(self, df):
-        try:
-            df = df.copy()
-            
-            if self.operator == '==':
-                result = df[df[self.column] == self.value]
-            elif self.operator == '!=':
-                result = df[df[self.column] != self.value]
-            elif self.operator == '>':
-                result = df[df[self.column] > self.value]
-            elif self.operator == '<':
-                result = df[df[self.column] < self.value]
-            elif self.operator == '>=':
-                result = df[df[self.column] >= self.value]
-            elif self.operator == '<=':
-                result = df[df[self.column] <= self.value]
-            elif self.operator == 'contains':
-                result = df[df[self.column].astype(str).str.contains(str(self.value))]
-            elif self.operator == 'in':
-                result = df[df[self.column].isin(self.value)]
-            else:
-                raise ValueError(f"Unknown operator: {self.operator}")
-            
-            return result
-        except Exception as e:
-            raise ValueError(f"Filter failed: {str(e)}")
+        # iloc with a boolean ndarray avoids index alignment
+        return df.iloc[self._compute_mask(df)]
 
 
 class ReplaceValues:    
-    def __init__(self, column, old_value, new_value):
+    def __init__(self, column, old_value, new_value=_MISSING):
+        if isinstance(old_value, dict):
+            if new_value is not _MISSING:
+                raise ValueError("new_value cannot be used with a mapping of old -> new values")
+        elif new_value is _MISSING:
+            raise ValueError("new_value is required unless old_value is a mapping")
+        
         self.column = column
         self.old_value = old_value
-        self.new_value = new_value
+        self.new_value = None if new_value is _MISSING else new_value
+        
+        # A dict of old -> new values is applied in a single column pass;
+        # a list of old values is handed to Series.replace as is
+        if isinstance(old_value, dict):
+            self.mapping = dict(old_value)
+        elif pd.api.types.is_list_like(old_value):
+            self.mapping = None
+        else:
+            self.mapping = {old_value: new_value}
+    
+    @property
+    def _output_column(self):
+        return self.column
+    
+    def _row_local(self, df):
+        # Series.replace infers the result dtype from the values present,
+        # so dropping rows first can change it
+        return False
+    
+    def _compute_column(self, df):
+        column = df[self.column]
+        
+        # Replace the values
+        if self.mapping is None:
+            return column.replace(self.old_value, self.new_value, regex=False)
+        if isinstance(column.array, pd.arrays.ArrowStringArray) and all(
+            isinstance(value, str) for pair in self.mapping.items() for value in pair
+        ):
+            return _replace_arrow_strings(column, self.mapping)
+        return column.replace(self.mapping, regex=False)
     
     def apply(self, df):
-        try:
-            df = df.copy()
-            
-            # Replace the values
-            df[self.column] = df[self.column].replace(
-                self.old_value, 
-                self.new_value
-            )
-            
-            return df
-        except Exception as e:
-            raise ValueError(f"Replace failed: {str(e)}")
+        return _with_column(df, self.column, self._compute_column(df))
 
 class MergeColumns:    
     def __init__(self, columns, new_column_name='Merged', separator=' '):
+        if len(columns) == 0:
+            raise ValueError("At least one column is required to merge")
+        
         self.columns = columns
         self.new_column_name = new_column_name
         self.separator = separator
     
+    @property
+    def _output_column(self):
+        return self.new_column_name
+    
+    def _row_local(self, df):
+        return all(_formats_per_row(df, column) for column in self.columns)
+    
+    def _compute_column(self, df):
+        # Convert all columns to string and concatenate column-wise
+        parts = [df[column].astype(str) for column in self.columns]
+        return parts[0].str.cat(parts[1:], sep=self.separator)
+    
     def apply(self, df):
-        try:
-            df = df.copy()
-            
-            # Convert all columns to string and merge
-            df[self.new_column_name] = df[self.columns].astype(str).agg(
-                self.separator.join, axis=1
-            )
-            
-            return df
-        except Exception as e:
-            raise ValueError(f"Merge columns failed: {str(e)}")
+        return _with_column(df, self.new_column_name, self._compute_column(df))
 
 class NormalizeText:
     def __init__(self, column, method='lower'):
@@ -109,51 +334,112 @@ class NormalizeText:
         
         self.column = column
         self.method = method
+        self._str_method = _TEXT_METHODS[method]
+    
+    @property
+    def _output_column(self):
+        return self.column
+    
+    def _row_local(self, df):
+        return _formats_per_row(df, self.column)
+    
+    def _compute_column(self, df):
+        # A single cast to a string dtype; with pyarrow the .str methods
+        # run as Arrow utf8 compute kernels
+        text = df[self.column].astype(_STRING_DTYPE)
+        return getattr(text.str, self._str_method)()
     
     def apply(self, df):
-        try:
-            df = df.copy()
-            
-            # Convert to string first
-            df[self.column] = df[self.column].astype(str)
-            
-            if self.method == 'lower':
-                df[self.column] = df[self.column].str.lower()
-            elif self.method == 'upper':
-                df[self.column] = df[self.column].str.upper()
-            elif self.method == 'title':
-                df[self.column] = df[self.column].str.title()
-            elif self.method == 'trim':
-                df[self.column] = df[self.column].str.strip()
-            elif self.method == 'capitalize':
-                df[self.column] = df[self.column].str.capitalize()
-            
-            return df
-        except Exception as e:
-            raise ValueError(f"Text normalization failed: {str(e)}")
+        return _with_column(df, self.column, self._compute_column(df))
 
 class ConvertDateFormat:
     def __init__(self, column, from_format='auto', to_format='%Y-%m-%d'):
         self.column = column
         self.from_format = from_format
         self.to_format = to_format
+        
+        # Parse arguments are fixed per operation, so build them once
+        self._parse_kwargs = {'cache': True}
+        if from_format != 'auto':
+            self._parse_kwargs.update(format=from_format, exact=True)
+    
+    @property
+    def _output_column(self):
+        return self.column
+    
+    def _row_local(self, df):
+        # 'auto' parsing infers the format from the column's first value,
+        # and parse errors depend on which rows are present
+        return False
+    
+    def _compute_column(self, df):
+        # Parse dates
+        parsed = pd.to_datetime(df[self.column], **self._parse_kwargs)
+        
+        # Format dates
+        if self.to_format == _ISO_DATE and parsed.dt.tz is None:
+            # numpy renders day-precision datetimes as ISO text in C,
+            # avoiding strftime's per-row Python formatting
+            days = parsed.to_numpy(dtype='datetime64[D]').astype(str)
+            return pd.Series(
+                days, 
+                index=parsed.index, 
+                name=parsed.name
+            ).where(parsed.notna())
+        return parsed.dt.strftime(self.to_format)
     
     def apply(self, df):
-        try:
-            df = df.copy()
-            
-            # Parse dates
-            if self.from_format == 'auto':
-                df[self.column] = pd.to_datetime(df[self.column])
+        return _with_column(df, self.column, self._compute_column(df))
+
+
+class Pipeline:
+    def __init__(self, operations):
+        self.operations = list(operations)
+    
+    def apply(self, df):
+        result = df
+        mask = None
+        pending = []
+        
+        for op in self.operations:
+            if isinstance(op, FilterRows):
+                if op.column not in {p._output_column for p in pending} and all(
+                    p._row_local(result) for p in pending
+                ):
+                    # Filters only read their own column, so a filter that
+                    # doesn't depend on pending column operations is folded
+                    # into one combined mask and runs before them, as long
+                    # as each of them gives the same value and dtype for a
+                    # row whichever other rows are present (_row_local)
+                    op_mask = op._compute_mask(result)
+                    mask = op_mask if mask is None else mask & op_mask
+                    continue
+                
+                result = self._flush(result, mask, pending)
+                pending = []
+                mask = op._compute_mask(result)
+            elif hasattr(op, '_compute_column'):
+                if mask is not None:
+                    result = self._flush(result, mask, pending)
+                    mask = None
+                    pending = []
+                pending.append(op)
             else:
-                df[self.column] = pd.to_datetime(
-                    df[self.column], 
-                    format=self.from_format
-                )
-            
-            # Format dates
-            df[self.column] = df[self.column].dt.strftime(self.to_format)
-            
-            return df
-        except Exception as e:
-            raise ValueError(f"Date conversion failed: {str(e)}")
+                result = self._flush(result, mask, pending)
+                mask = None
+                pending = []
+                result = op.apply(result)
+        
+        return self._flush(result, mask, pending)
+    
+    @staticmethod
+    def _flush(df, mask, pending):
+        # Slice rows once for all folded filters, then add every pending
+        # column to a single shallow copy
+        if mask is not None:
+            df = df.iloc[mask]
+        if pending:
+            df = df.copy(deep=False)
+            for op in pending:
+                df[op._output_column] = op._compute_column(df)
+        return df
@@ -1,14 +1,77 @@
+import hashlib
+import io
+import os
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# pandas only ships the calamine reader from 2.2 onwards; otherwise leave
+# the engine to pandas, which picks one from the file's format (.xls, .ods,
+# .xlsb as well as .xlsx)
+_PANDAS_HAS_CALAMINE = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+_EXCEL_ENGINE = 'calamine' if CalamineWorkbook is not None and _PANDAS_HAS_CALAMINE else None
+_EXCEL_WRITER = 'xlsxwriter' if xlsxwriter is not None else 'openpyxl'
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _read_sheet_names(file_path):
+    # Read sheet names straight from xl/workbook.xml instead of loading
+    # the whole workbook (styles, shared strings, worksheets). Chart sheets
+    # are listed there too, so keep only entries whose relationship in
+    # workbook.xml.rels points at a worksheet, matching pd.ExcelFile.
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open('xl/_rels/workbook.xml.rels') as rels_xml:
+            worksheet_ids = {
+                elem.get('Id')
+                for _, elem in ET.iterparse(rels_xml)
+                if _local_name(elem.tag) == 'Relationship'
+                and elem.get('Type', '').endswith('/worksheet')
+            }
+        
+        with archive.open('xl/workbook.xml') as workbook_xml:
+            names = []
+            for _, elem in ET.iterparse(workbook_xml):
+                if _local_name(elem.tag) != 'sheet':
+                    continue
+                rel_id = next(
+                    (value for key, value in elem.attrib.items() if _local_name(key) == 'id'),
+                    None
+                )
+                if rel_id in worksheet_ids:
+                    names.append(elem.get('name'))
+            return names
+
 
 def validate_excel_file(file_path):
     try:
         if not file_path.endswith('.xlsx'):
             raise ValueError("File must be .xlsx format")
         
-        wb = load_workbook(file_path, data_only=True)
-        if len(wb.sheetnames) == 0:
+        if len(_read_sheet_names(file_path)) == 0:
             raise ValueError("Excel file has no sheets")
         
         return True
@@ -16,29 +79,186 @@ def validate_excel_file(file_path):
         raise ValueError(f"File validation failed: {str(e)}")
 
 
+def _cache_path(file_path, sheet_name):
+    cache_dir = os.environ.get('XLSX_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'xlsx_cache'))
+    key = f"{os.path.abspath(file_path)}:{os.path.getmtime(file_path)}:{sheet_name}"
+    return os.path.join(cache_dir, hashlib.md5(key.encode()).hexdigest() + '.parquet')
+
+
+def _write_cache(df, cache_path):
+    # Write then rename so a concurrent reader never sees a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.to_parquet(tmp_path, compression='zstd', engine='pyarrow')
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Mixed-type object columns can't be stored as Parquet; skip caching
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_cache(cache_path):
+    df = pd.read_parquet(cache_path, engine='pyarrow')
+    # Parquet hands missing object values back as None; a fresh Excel parse
+    # gives NaN, which later operations render differently ('nan' vs 'None')
+    for column in df.columns[df.dtypes == object]:
+        df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
+
+
+def _read_excel(file_path, sheet_name):
+    if isinstance(file_path, (str, os.PathLike)):
+        # Read the file in one go into a memory buffer, so the reader's zip
+        # seeks are served from memory instead of each hitting the file.
+        # This holds one full copy of the (compressed) file in RAM.
+        with open(file_path, 'rb') as fh:
+            file_path = io.BytesIO(fh.read())
+    
+    # read_excel resolves integer sheet positions itself, so the
+    # workbook only has to be opened once
+    return pd.read_excel(file_path, sheet_name=sheet_name, engine=_EXCEL_ENGINE)
+
+
 def load_excel_file(file_path, sheet_name=0):
     try:
-        if isinstance(sheet_name, int):
-            excel_file = pd.ExcelFile(file_path)
-            sheet_name = excel_file.sheet_names[sheet_name]
+        cache_path = None
+        # Only single-sheet loads are cached; sheet_name=None or a list
+        # returns a dict of frames
+        if (os.environ.get('XLSX_CACHE') == '1' and pa is not None
+                and isinstance(file_path, (str, os.PathLike))
+                and isinstance(sheet_name, (str, int))):
+            # Parsed sheets are cached as Parquet, keyed by path, mtime and sheet
+            cache_path = _cache_path(file_path, sheet_name)
+            if os.path.exists(cache_path):
+                return _read_cache(cache_path)
+        
+        df = _read_excel(file_path, sheet_name)
         
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        if cache_path is not None:
+            _write_cache(df, cache_path)
         return df
     except Exception as e:
         raise ValueError(f"Failed to load Excel file: {str(e)}")
 
 
+def _trim_row(row):
+    # Styled but empty cells come back as trailing Nones; drop them as
+    # pandas' openpyxl reader does
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return row
+
+
+def load_excel_chunks(file_path, sheet_name=0, chunksize=50_000):
+    try:
+        wb = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    except Exception as e:
+        raise ValueError(f"Failed to load Excel file: {str(e)}")
+    
+    try:
+        ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+        # Read-only mode trusts the sheet's stored <dimension>, which some
+        # writers leave stale; recompute it from the rows actually present
+        ws.reset_dimensions()
+        
+        # Stream row tuples instead of materializing the whole sheet
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        
+        header = _trim_row(header)
+        width = len(header)
+        columns = [
+            f"Unnamed: {position}" if name is None else name
+            for position, name in enumerate(header)
+        ]
+        
+        buffer = []
+        blank_rows = 0
+        for row in rows:
+            row = _trim_row(row)
+            if not row:
+                # Blank rows are kept only if more data follows them
+                blank_rows += 1
+                continue
+            if len(row) > width:
+                raise ValueError(f"Row has {len(row)} values but the header has {width} columns")
+            
+            buffer.extend([[None] * width] * blank_rows)
+            blank_rows = 0
+            buffer.append(row + [None] * (width - len(row)))
+            
+            while len(buffer) >= chunksize:
+                yield pd.DataFrame(buffer[:chunksize], columns=columns)
+                buffer = buffer[chunksize:]
+        
+        if buffer:
+            yield pd.DataFrame(buffer, columns=columns)
+    except (IndexError, KeyError) as e:
+        raise ValueError(f"Failed to load Excel file: {str(e)}")
+    finally:
+        wb.close()
+
+
+def load_all_sheets(file_path, max_workers=None):
+    try:
+        sheet_names = get_sheet_names(file_path)
+        
+        if len(sheet_names) <= 1 or not isinstance(file_path, (str, os.PathLike)):
+            return {name: load_excel_file(file_path, sheet_name=name) for name in sheet_names}
+        
+        # calamine parses in native code so threads are enough; the other
+        # readers (openpyxl, xlrd, odf) are pure Python and hold the GIL, so
+        # they need separate processes
+        if _EXCEL_ENGINE == 'calamine':
+            executor_class = ThreadPoolExecutor
+        else:
+            executor_class = ProcessPoolExecutor
+        
+        workers = max_workers or min(len(sheet_names), os.cpu_count() or 1)
+        with executor_class(max_workers=workers) as executor:
+            frames = executor.map(load_excel_file, repeat(file_path), sheet_names)
+            return dict(zip(sheet_names, frames))
+    except Exception as e:
+        raise ValueError(f"Failed to load Excel sheets: {str(e)}")
+
+
 def get_sheet_names(file_path):
     try:
+        if isinstance(file_path, str) and file_path.endswith('.xlsx'):
+            return _read_sheet_names(file_path)
+        
+        if CalamineWorkbook is not None and isinstance(file_path, str):
+            return CalamineWorkbook.from_path(file_path).sheet_names
+        
         excel_file = pd.ExcelFile(file_path)
         return excel_file.sheet_names
     except Exception as e:
         raise ValueError(f"Failed to read sheets: {str(e)}")
 
 
-def save_excel_file(df, output_path, sheet_name='Transformed'):
+def save_excel_file(df, output_path, sheet_name='Transformed', format='auto'):
     try:
-        df.to_excel(output_path, sheet_name=sheet_name, index=False)
+        valid_formats = ['auto', 'xlsx', 'parquet']
+        if format not in valid_formats:
+            raise ValueError(f"Format must be one of: {valid_formats}")
+        
+        if format == 'parquet' or (format == 'auto' and str(output_path).endswith('.parquet')):
+            df.to_parquet(output_path, compression='zstd', engine='pyarrow', index=False)
+        else:
+            # XlsxWriter turns URL-like text into hyperlinks by default;
+            # keep writing plain strings as openpyxl did
+            engine_kwargs = {'options': {'strings_to_urls': False}} if _EXCEL_WRITER == 'xlsxwriter' else None
+            df.to_excel(
+                output_path, 
+                sheet_name=sheet_name, 
+                index=False, 
+                engine=_EXCEL_WRITER, 
+                engine_kwargs=engine_kwargs
+            )
         return True
     except Exception as e:
         raise ValueError(f"Failed to save Excel file: {str(e)}")
@@ -0,0 +1,343 @@
+import os
+import re
+import zipfile
+import pytest
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.chart import BarChart, Reference
+from openpyxl.styles import Font
+from src.file_handler import (
+    validate_excel_file, get_sheet_names, load_excel_file, load_all_sheets, load_excel_chunks,
+    save_excel_file,
+)
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """Create a two-sheet workbook on disk."""
+    path = tmp_path / 'input.xlsx'
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'id': [1, 2]}).to_excel(writer, sheet_name='First', index=False)
+        pd.DataFrame({'id': [3]}).to_excel(writer, sheet_name='Second', index=False)
+    return str(path)
+
+
+@pytest.fixture
+def chart_workbook_path(tmp_path):
+    """Create a workbook with a chart sheet between two worksheets."""
+    path = tmp_path / 'chart.xlsx'
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Data'
+    ws.append(['id', 'value'])
+    ws.append([1, 10])
+    chart = BarChart()
+    chart.add_data(Reference(ws, min_col=2, min_row=1, max_row=2))
+    wb.create_chartsheet('Chart').add_chart(chart)
+    wb.create_sheet('More').append(['id'])
+    wb.save(path)
+    return str(path)
+
+
+class TestSheetNames:
+    """Tests for workbook validation and sheet discovery."""
+    
+    def test_validate_workbook(self, workbook_path):
+        """Test that a valid workbook passes validation."""
+        assert validate_excel_file(workbook_path) is True
+    
+    def test_validate_wrong_extension(self):
+        """Test that non-xlsx paths are rejected."""
+        with pytest.raises(ValueError):
+            validate_excel_file('data.csv')
+    
+    def test_validate_not_a_zip(self, tmp_path):
+        """Test that a corrupt .xlsx file is rejected."""
+        path = tmp_path / 'broken.xlsx'
+        path.write_text('not a workbook')
+        
+        with pytest.raises(ValueError):
+            validate_excel_file(str(path))
+    
+    def test_sheet_names_in_order(self, workbook_path):
+        """Test that sheet names are returned in workbook order."""
+        assert get_sheet_names(workbook_path) == ['First', 'Second']
+    
+    def test_chart_sheets_excluded(self, chart_workbook_path):
+        """Test that chart sheets are skipped, as pd.ExcelFile does."""
+        assert get_sheet_names(chart_workbook_path) == ['Data', 'More']
+        assert get_sheet_names(chart_workbook_path) == pd.ExcelFile(chart_workbook_path).sheet_names
+
+
+class TestLoadExcelFile:
+    """Tests for loading a single sheet."""
+    
+    def test_load_by_index(self, workbook_path):
+        """Test loading a sheet by its position."""
+        result = load_excel_file(workbook_path, sheet_name=1)
+        
+        assert result['id'].tolist() == [3]
+    
+    def test_load_by_name(self, workbook_path):
+        """Test loading a sheet by its name."""
+        result = load_excel_file(workbook_path, sheet_name='First')
+        
+        assert result['id'].tolist() == [1, 2]
+    
+    def test_load_from_file_object(self, workbook_path):
+        """Test loading from an already-open binary file."""
+        with open(workbook_path, 'rb') as fh:
+            result = load_excel_file(fh, sheet_name='Second')
+        
+        assert result['id'].tolist() == [3]
+    
+    def test_load_ods(self, tmp_path):
+        """Test that non-xlsx workbooks are read with a matching engine."""
+        pytest.importorskip('odf')
+        path = str(tmp_path / 'input.ods')
+        pd.DataFrame({'id': [1, 2]}).to_excel(path, sheet_name='First', index=False)
+        
+        result = load_excel_file(path, sheet_name='First')
+        
+        assert result['id'].tolist() == [1, 2]
+    
+    def test_missing_sheet(self, workbook_path):
+        """Test that an out-of-range sheet index raises error."""
+        with pytest.raises(ValueError):
+            load_excel_file(workbook_path, sheet_name=5)
+
+
+class TestLoadAllSheets:
+    """Tests for loading every sheet of a workbook."""
+    
+    def test_all_sheets_loaded(self, workbook_path):
+        """Test that each sheet is returned under its name, in order."""
+        result = load_all_sheets(workbook_path)
+        
+        assert list(result) == ['First', 'Second']
+        assert result['First']['id'].tolist() == [1, 2]
+        assert result['Second']['id'].tolist() == [3]
+    
+    def test_chart_sheet_skipped(self, chart_workbook_path):
+        """Test that a workbook with a chart sheet loads its worksheets."""
+        result = load_all_sheets(chart_workbook_path)
+        
+        assert list(result) == ['Data', 'More']
+        assert result['Data']['value'].tolist() == [10]
+    
+    def test_single_worker(self, workbook_path):
+        """Test loading with an explicit worker count."""
+        result = load_all_sheets(workbook_path, max_workers=1)
+        
+        assert result['Second']['id'].tolist() == [3]
+    
+    def test_missing_file(self, tmp_path):
+        """Test that a missing workbook raises error."""
+        with pytest.raises(ValueError):
+            load_all_sheets(str(tmp_path / 'missing.xlsx'))
+
+
+class TestLoadExcelChunks:
+    """Tests for streaming a sheet in row chunks."""
+    
+    @pytest.fixture
+    def large_path(self, tmp_path):
+        """Create a workbook with a 25-row sheet."""
+        path = tmp_path / 'large.xlsx'
+        pd.DataFrame({'id': range(25), 'name': [f'row{i}' for i in range(25)]}).to_excel(
+            path, sheet_name='Data', index=False
+        )
+        return str(path)
+    
+    def test_chunk_sizes(self, large_path):
+        """Test that rows are split into chunks of the requested size."""
+        chunks = list(load_excel_chunks(large_path, chunksize=10))
+        
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert list(chunks[0].columns) == ['id', 'name']
+    
+    def test_chunks_match_full_load(self, large_path):
+        """Test that concatenated chunks equal a full sheet load."""
+        chunks = load_excel_chunks(large_path, sheet_name='Data', chunksize=7)
+        result = pd.concat(chunks, ignore_index=True)
+        
+        assert result.equals(load_excel_file(large_path, sheet_name='Data'))
+    
+    def test_stale_dimension(self, large_path, tmp_path):
+        """Test that a sheet whose stored dimension is stale is still read fully."""
+        path = str(tmp_path / 'stale.xlsx')
+        with zipfile.ZipFile(large_path) as src, zipfile.ZipFile(path, 'w') as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename.startswith('xl/worksheets/'):
+                    data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+                dst.writestr(item, data)
+        
+        result = pd.concat(load_excel_chunks(path, chunksize=10), ignore_index=True)
+        
+        assert result.shape == (25, 2)
+        assert result.equals(load_excel_file(path))
+    
+    def test_styled_empty_cells_trimmed(self, tmp_path):
+        """Test that styled blank cells add no rows or columns, as in a full load."""
+        path = str(tmp_path / 'styled.xlsx')
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['id', 'name'])
+        ws.append([1, 'a'])
+        ws.append([None, None])
+        ws.append([3, 'c'])
+        ws['A3'].font = Font(bold=True)
+        ws['D1'].font = Font(bold=True)
+        for row in range(5, 9):
+            ws.cell(row, 1).font = Font(bold=True)
+        wb.save(path)
+        
+        result = pd.concat(load_excel_chunks(path, chunksize=2), ignore_index=True)
+        expected = load_excel_file(path)
+        
+        assert list(result.columns) == ['id', 'name']
+        assert result.shape == expected.shape == (3, 2)
+        assert result['name'].tolist()[::2] == expected['name'].tolist()[::2] == ['a', 'c']
+        assert result.iloc[1].isna().all()
+    
+    def test_sheet_by_index(self, workbook_path):
+        """Test streaming a sheet selected by position."""
+        chunks = list(load_excel_chunks(workbook_path, sheet_name=1))
+        
+        assert len(chunks) == 1
+        assert chunks[0]['id'].tolist() == [3]
+    
+    def test_missing_sheet(self, workbook_path):
+        """Test that an unknown sheet raises error."""
+        with pytest.raises(ValueError):
+            list(load_excel_chunks(workbook_path, sheet_name='Nope'))
+
+
+class TestSaveExcelFile:
+    """Tests for saving transformed data."""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """Create sample DataFrame."""
+        return pd.DataFrame({'id': [1, 2, 3], 'name': ['Alice', 'Bob', 'Charlie']})
+    
+    def test_save_xlsx(self, sample_df, tmp_path):
+        """Test that xlsx output round-trips with the given sheet name."""
+        path = str(tmp_path / 'out.xlsx')
+        assert save_excel_file(sample_df, path, sheet_name='Result') is True
+        
+        assert get_sheet_names(path) == ['Result']
+        assert load_excel_file(path).equals(sample_df)
+    
+    def test_urls_saved_as_text(self, tmp_path):
+        """Test that URL-like strings are written as plain text, not hyperlinks."""
+        df = pd.DataFrame({'site': ['https://example.com/a', 'mailto:team@example.com']})
+        path = str(tmp_path / 'links.xlsx')
+        save_excel_file(df, path)
+        
+        ws = load_workbook(path)['Transformed']
+        for cell in (ws['A2'], ws['A3']):
+            assert cell.hyperlink is None
+            assert cell.data_type == 's'
+        assert ws['A2'].value == 'https://example.com/a'
+    
+    def test_save_parquet_by_extension(self, sample_df, tmp_path):
+        """Test that a .parquet path is written as Parquet."""
+        pytest.importorskip('pyarrow')
+        path = str(tmp_path / 'out.parquet')
+        save_excel_file(sample_df, path)
+        
+        assert pd.read_parquet(path).equals(sample_df)
+    
+    def test_save_parquet_explicit(self, sample_df, tmp_path):
+        """Test forcing Parquet output regardless of extension."""
+        pytest.importorskip('pyarrow')
+        path = str(tmp_path / 'out.bin')
+        save_excel_file(sample_df, path, format='parquet')
+        
+        assert pd.read_parquet(path).equals(sample_df)
+    
+    def test_save_parquet_drops_index(self, sample_df, tmp_path):
+        """Test that a filtered frame's index isn't written as a column."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        filtered = sample_df.iloc[1:]
+        path = str(tmp_path / 'out.parquet')
+        save_excel_file(filtered, path)
+        
+        assert '__index_level_0__' not in pq.read_schema(path).names
+        assert pd.read_parquet(path).equals(filtered.reset_index(drop=True))
+    
+    def test_invalid_format(self, sample_df, tmp_path):
+        """Test that an unknown format raises error."""
+        with pytest.raises(ValueError):
+            save_excel_file(sample_df, str(tmp_path / 'out.csv'), format='csv')
+
+
+class TestParquetCache:
+    """Tests for the opt-in Parquet cache used by load_excel_file."""
+    
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Enable the cache in a temporary directory."""
+        pytest.importorskip('pyarrow')
+        cache_dir = tmp_path / 'cache'
+        monkeypatch.setenv('XLSX_CACHE', '1')
+        monkeypatch.setenv('XLSX_CACHE_DIR', str(cache_dir))
+        return cache_dir
+    
+    def test_cache_written_and_reused(self, workbook_path, cache_dir):
+        """Test that a second load is served from the cache."""
+        first = load_excel_file(workbook_path, sheet_name='First')
+        assert len(os.listdir(cache_dir)) == 1
+        
+        second = load_excel_file(workbook_path, sheet_name='First')
+        assert second.equals(first)
+    
+    def test_cache_hit_matches_fresh_parse(self, tmp_path, cache_dir):
+        """Test that cached rows have the same values as a fresh parse."""
+        path = str(tmp_path / 'mixed.xlsx')
+        pd.DataFrame({'name': ['Alice', None, 'Carol'], 'score': [1.5, None, 3.0]}).to_excel(
+            path, index=False
+        )
+        fresh = load_excel_file(path)
+        cached = load_excel_file(path)
+        assert len(os.listdir(cache_dir)) == 1
+        
+        for column in fresh.columns:
+            assert cached[column].dtype == fresh[column].dtype
+            assert [repr(value) for value in cached[column]] == [repr(value) for value in fresh[column]]
+        assert cached['name'].astype(str).tolist() == ['Alice', 'nan', 'Carol']
+    
+    def test_cache_keyed_by_sheet(self, workbook_path, cache_dir):
+        """Test that different sheets get separate cache entries."""
+        load_excel_file(workbook_path, sheet_name=0)
+        result = load_excel_file(workbook_path, sheet_name=1)
+        
+        assert result['id'].tolist() == [3]
+        assert len(os.listdir(cache_dir)) == 2
+    
+    def test_cache_invalidated_on_change(self, workbook_path, cache_dir):
+        """Test that rewriting the workbook bypasses the stale entry."""
+        load_excel_file(workbook_path, sheet_name='First')
+        pd.DataFrame({'id': [9]}).to_excel(workbook_path, sheet_name='First', index=False)
+        stat = os.stat(workbook_path)
+        os.utime(workbook_path, (stat.st_atime, stat.st_mtime + 10))
+        
+        assert load_excel_file(workbook_path, sheet_name='First')['id'].tolist() == [9]
+    
+    @pytest.mark.parametrize('sheet_name', [None, ['First', 'Second']])
+    def test_multi_sheet_load_not_cached(self, workbook_path, cache_dir, sheet_name):
+        """Test that loads returning several sheets bypass the cache."""
+        result = load_excel_file(workbook_path, sheet_name=sheet_name)
+        
+        assert list(result) == ['First', 'Second']
+        assert result['Second']['id'].tolist() == [3]
+        assert not cache_dir.exists()
+    
+    def test_cache_disabled_by_default(self, workbook_path, tmp_path, monkeypatch):
+        """Test that nothing is cached unless XLSX_CACHE is set."""
+        monkeypatch.delenv('XLSX_CACHE', raising=False)
+        monkeypatch.setenv('XLSX_CACHE_DIR', str(tmp_path / 'cache'))
+        load_excel_file(workbook_path)
+        
+        assert not (tmp_path / 'cache').exists()
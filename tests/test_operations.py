@@ -1,7 +1,10 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.operations import RemoveDuplicates, FilterRows, ReplaceValues
+from src.operations import (
+    RemoveDuplicates, FilterRows, ReplaceValues, MergeColumns, NormalizeText, ConvertDateFormat,
+    Pipeline,
+)
 
 class TestRemoveDuplicates:
     """Tests for RemoveDuplicates operation."""
@@ -40,6 +43,64 @@ class TestRemoveDuplicates:
         # Check that last index is kept
         assert 6 in result.index  # Last Eve row
     
+    def test_bool_columns(self):
+        """Test deduplicating a frame of only boolean columns."""
+        df = pd.DataFrame({
+            'a': [True, True, False, True],
+            'b': [False, False, False, True],
+        })
+        result = RemoveDuplicates().apply(df)
+        
+        assert result.index.tolist() == [0, 2, 3]
+    
+    def test_small_int_columns(self):
+        """Test deduplicating small integer columns, including negatives."""
+        df = pd.DataFrame({
+            'a': np.array([-1, -1, 1, 2, 1], dtype='int8'),
+            'b': np.array([300, 300, -300, 7, -300], dtype='int16'),
+            'flag': [True, True, False, False, True],
+        })
+        
+        for keep in ['first', 'last', False]:
+            result = RemoveDuplicates(keep=keep).apply(df)
+            assert result.equals(df.drop_duplicates(keep=keep))
+    
+    def test_categorical_columns(self):
+        """Test deduplicating categorical columns, including missing values."""
+        df = pd.DataFrame({
+            'city': pd.Categorical(['NYC', 'LA', None, 'NYC', None, 'LA']),
+            'active': [True, False, True, True, True, True],
+        })
+        
+        for keep in ['first', 'last', False]:
+            result = RemoveDuplicates(keep=keep).apply(df)
+            assert result.equals(df.drop_duplicates(keep=keep))
+    
+    def test_single_column_label(self, sample_df):
+        """Test passing one column name instead of a list."""
+        op = RemoveDuplicates(columns='id')
+        result = op.apply(sample_df)
+        
+        assert result.shape[0] == 5
+    
+    def test_original_unchanged(self, sample_df):
+        """Test that original DataFrame is not modified."""
+        original_copy = sample_df.copy()
+        result = RemoveDuplicates(columns=['id']).apply(sample_df)
+        
+        assert sample_df.equals(original_copy)
+        assert result is not sample_df
+    
+    def test_invalid_keep(self):
+        """Test that invalid keep value raises error."""
+        with pytest.raises(ValueError):
+            RemoveDuplicates(keep='middle')
+    
+    def test_missing_column(self, sample_df):
+        """Test that an unknown subset column raises KeyError."""
+        with pytest.raises(KeyError):
+            RemoveDuplicates(columns=['missing']).apply(sample_df)
+    
     def test_empty_dataframe(self):
         """Test with empty DataFrame."""
         df = pd.DataFrame()
@@ -102,6 +163,71 @@ class TestFilterRows:
         
         assert result.shape[0] == 3
     
+    def test_filter_not_equals_string(self, sample_df):
+        """Test filtering a text column with != operator."""
+        op = FilterRows('city', '!=', 'NYC')
+        result = op.apply(sample_df)
+        
+        assert result['name'].tolist() == ['Bob', 'David', 'Eve']
+    
+    def test_filter_contains_literal(self):
+        """Test that contains matches the value literally, not as a regex."""
+        df = pd.DataFrame({'code': ['A.1', 'AB1', 'A+1']})
+        
+        assert FilterRows('code', 'contains', 'A.').apply(df)['code'].tolist() == ['A.1']
+        assert FilterRows('code', 'contains', 'A+').apply(df)['code'].tolist() == ['A+1']
+    
+    def test_filter_contains_skips_missing(self):
+        """Test that missing values never match contains."""
+        df = pd.DataFrame({'city': ['Boston', None, np.nan, 'Nantes']})
+        result = FilterRows('city', 'contains', 'n').apply(df)
+        
+        assert result.index.tolist() == [0, 3]
+    
+    def test_filter_contains_mixed_types(self):
+        """Test contains on a column mixing text and numbers."""
+        df = pd.DataFrame({'code': ['A12', 112, 3.5, 'B7']})
+        result = FilterRows('code', 'contains', '12').apply(df)
+        
+        assert result.index.tolist() == [0, 1]
+    
+    def test_filter_with_missing_values(self):
+        """Test that missing values never match a comparison."""
+        df = pd.DataFrame({'score': [1.0, np.nan, 3.0]})
+        op = FilterRows('score', '>=', 1)
+        result = op.apply(df)
+        
+        assert result.index.tolist() == [0, 2]
+    
+    def test_filter_large_numeric(self):
+        """Test comparisons on a frame large enough for the parallel kernels."""
+        values = np.arange(200_000, dtype='int64') % 1000
+        df = pd.DataFrame({'value': values, 'ratio': values / 1000.0})
+        
+        assert np.array_equal(FilterRows('value', '>=', 990).apply(df).index, np.flatnonzero(values >= 990))
+        assert np.array_equal(FilterRows('ratio', '<', 0.5).apply(df).index, np.flatnonzero(values < 500))
+        assert len(FilterRows('value', '==', 2 ** 70).apply(df)) == 0
+    
+    @pytest.mark.parametrize('dtype', ['float32', 'float16'])
+    @pytest.mark.parametrize('operator', ['==', '<=', '>'])
+    def test_filter_large_narrow_floats(self, dtype, operator):
+        """Test that large narrow-float columns compare like numpy does."""
+        values = np.full(200_000, 0.1, dtype=dtype)
+        values[::3] = 0.2
+        df = pd.DataFrame({'x': values})
+        expected = {'==': values == 0.1, '<=': values <= 0.1, '>': values > 0.1}[operator]
+        
+        result = FilterRows('x', operator, 0.1).apply(df)
+        
+        assert np.array_equal(result.index, np.flatnonzero(expected))
+    
+    def test_filter_keeps_index(self, sample_df):
+        """Test that filtered rows keep their original index labels."""
+        op = FilterRows('age', '<', 30)
+        result = op.apply(sample_df)
+        
+        assert result.index.tolist() == [0, 3]
+    
     def test_invalid_operator(self):
         """Test that invalid operator raises error."""
         with pytest.raises(ValueError):
@@ -159,6 +285,68 @@ class TestReplaceValues:
         # Should return unchanged
         assert result.equals(sample_df)
     
+    def test_replace_mapping(self, sample_df):
+        """Test replacing several values with a dict in one operation."""
+        op = ReplaceValues('city', {'NYC': 'New York', 'LA': 'Los Angeles'})
+        result = op.apply(sample_df)
+        
+        assert result['city'].tolist() == ['New York', 'Los Angeles', 'New York', 'Chicago', 'New York']
+    
+    def test_replace_with_none(self):
+        """Test that None is accepted as the replacement value."""
+        df = pd.DataFrame({'v': ['a', 'b']})
+        result = ReplaceValues('v', 'a', None).apply(df)
+        
+        assert result['v'].isna().tolist() == [True, False]
+    
+    def test_missing_new_value(self):
+        """Test that new_value is required for a single old value or a list."""
+        with pytest.raises(ValueError, match="new_value is required"):
+            ReplaceValues('name', 'Alice')
+        with pytest.raises(ValueError, match="new_value is required"):
+            ReplaceValues('name', ['Alice', 'Bob'])
+    
+    def test_mapping_with_new_value(self):
+        """Test that new_value is rejected alongside a mapping."""
+        with pytest.raises(ValueError, match="new_value cannot be used"):
+            ReplaceValues('name', {'Alice': 'Alicia'}, 'Bob')
+    
+    def test_replace_list_of_values(self):
+        """Test replacing several old values with one new value."""
+        df = pd.DataFrame({'value': [1, 2, 3, 2, 1]})
+        result = ReplaceValues('value', [1, 2], 0).apply(df)
+        
+        assert result['value'].tolist() == [0, 0, 3, 0, 0]
+    
+    def test_replace_is_not_regex(self):
+        """Test that values are matched exactly, not as patterns."""
+        df = pd.DataFrame({'code': ['A.1', 'AB1']})
+        result = ReplaceValues('code', 'A.1', 'X').apply(df)
+        
+        assert result['code'].tolist() == ['X', 'AB1']
+    
+    def test_replace_arrow_strings(self):
+        """Test replacing values in an Arrow-backed string column."""
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame({'city': pd.Series(['NYC', None, 'LA'], dtype='string[pyarrow]')})
+        result = ReplaceValues('city', {'NYC': 'New York'}).apply(df)
+        
+        assert result['city'].dtype == df['city'].dtype
+        assert result['city'].iloc[0] == 'New York'
+        assert pd.isna(result['city'].iloc[1])
+        assert result['city'].iloc[2] == 'LA'
+    
+    def test_replace_keeps_arrow_string_variant(self):
+        """Test that string[pyarrow_numpy] columns keep NaN missing values."""
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame({'city': pd.Series(['NYC', None], dtype='string[pyarrow_numpy]')})
+        result = ReplaceValues('city', {'NYC': 'New York'}).apply(df)
+        
+        assert result['city'].dtype == df['city'].dtype
+        assert type(result['city'].array) is type(df['city'].array)
+        assert result['city'].iloc[0] == 'New York'
+        assert result['city'].iloc[1] is np.nan
+    
     def test_original_unchanged(self, sample_df):
         """Test that original DataFrame is not modified."""
         original_copy = sample_df.copy()
@@ -166,4 +354,297 @@ class TestReplaceValues:
         result = op.apply(sample_df)
         
         # Original should be unchanged
-        assert sample_df.equals(original_copy)
\ No newline at end of file
+        assert sample_df.equals(original_copy)
+
+
+class TestMergeColumns:
+    """Tests for MergeColumns operation."""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """Create sample DataFrame."""
+        return pd.DataFrame({
+            'first': ['Alice', 'Bob'],
+            'last': ['Smith', 'Jones'],
+            'age': [25, 30],
+        })
+    
+    def test_merge_with_separator(self, sample_df):
+        """Test merging columns with a custom separator."""
+        op = MergeColumns(['first', 'last'], new_column_name='full', separator='-')
+        result = op.apply(sample_df)
+        
+        assert result['full'].tolist() == ['Alice-Smith', 'Bob-Jones']
+    
+    def test_merge_numeric(self, sample_df):
+        """Test that non-string columns are merged as text."""
+        op = MergeColumns(['first', 'age'])
+        result = op.apply(sample_df)
+        
+        assert result['Merged'].tolist() == ['Alice 25', 'Bob 30']
+    
+    def test_merge_missing_values(self):
+        """Test that missing values are merged as their text form."""
+        df = pd.DataFrame({'a': ['x', None], 'b': [1.5, np.nan]})
+        result = MergeColumns(['a', 'b']).apply(df)
+        
+        assert result['Merged'].tolist() == ['x 1.5', 'None nan']
+    
+    def test_no_columns(self):
+        """Test that merging nothing raises error."""
+        with pytest.raises(ValueError):
+            MergeColumns([])
+    
+    def test_original_unchanged(self, sample_df):
+        """Test that original DataFrame is not modified."""
+        op = MergeColumns(['first', 'last'])
+        op.apply(sample_df)
+        
+        assert 'Merged' not in sample_df.columns
+
+
+class TestNormalizeText:
+    """Tests for NormalizeText operation."""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """Create sample DataFrame."""
+        return pd.DataFrame({
+            'name': ['  alice ', 'BOB', 'charlie BROWN'],
+        })
+    
+    def test_lower(self, sample_df):
+        """Test lowercasing text."""
+        result = NormalizeText('name', 'lower').apply(sample_df)
+        
+        assert result['name'].tolist() == ['  alice ', 'bob', 'charlie brown']
+    
+    def test_title(self, sample_df):
+        """Test title-casing text."""
+        result = NormalizeText('name', 'title').apply(sample_df)
+        
+        assert result['name'].tolist() == ['  Alice ', 'Bob', 'Charlie Brown']
+    
+    def test_trim(self, sample_df):
+        """Test trimming whitespace."""
+        result = NormalizeText('name', 'trim').apply(sample_df)
+        
+        assert result['name'].tolist() == ['alice', 'BOB', 'charlie BROWN']
+    
+    def test_missing_values_preserved(self):
+        """Test that missing values stay missing instead of becoming text."""
+        df = pd.DataFrame({'name': ['Alice', np.nan]})
+        result = NormalizeText('name', 'upper').apply(df)
+        
+        assert result['name'].iloc[0] == 'ALICE'
+        assert pd.isna(result['name'].iloc[1])
+    
+    def test_invalid_method(self):
+        """Test that invalid method raises error."""
+        with pytest.raises(ValueError):
+            NormalizeText('name', 'reverse')
+    
+    def test_original_unchanged(self, sample_df):
+        """Test that original DataFrame is not modified."""
+        original_copy = sample_df.copy()
+        NormalizeText('name', 'upper').apply(sample_df)
+        
+        assert sample_df.equals(original_copy)
+
+
+class TestConvertDateFormat:
+    """Tests for ConvertDateFormat operation."""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """Create sample DataFrame."""
+        return pd.DataFrame({
+            'date': ['01/15/2024', '02/20/2024', '01/15/2024'],
+        })
+    
+    def test_explicit_format(self, sample_df):
+        """Test converting with an explicit input format."""
+        op = ConvertDateFormat('date', from_format='%m/%d/%Y')
+        result = op.apply(sample_df)
+        
+        assert result['date'].tolist() == ['2024-01-15', '2024-02-20', '2024-01-15']
+    
+    def test_custom_output_format(self, sample_df):
+        """Test converting to a non-ISO output format."""
+        op = ConvertDateFormat('date', from_format='%m/%d/%Y', to_format='%d.%m.%Y')
+        result = op.apply(sample_df)
+        
+        assert result['date'].tolist() == ['15.01.2024', '20.02.2024', '15.01.2024']
+    
+    def test_auto_format_with_missing(self):
+        """Test that missing dates stay missing in ISO output."""
+        df = pd.DataFrame({'date': ['2024-03-01 10:30', None]})
+        result = ConvertDateFormat('date').apply(df)
+        
+        assert result['date'].iloc[0] == '2024-03-01'
+        assert pd.isna(result['date'].iloc[1])
+    
+    def test_repeated_apply(self, sample_df):
+        """Test that an operation can be applied more than once."""
+        op = ConvertDateFormat('date', from_format='%m/%d/%Y')
+        
+        assert op.apply(sample_df).equals(op.apply(sample_df))
+    
+    def test_invalid_date(self):
+        """Test that unparseable dates raise error."""
+        df = pd.DataFrame({'date': ['not a date']})
+        op = ConvertDateFormat('date', from_format='%m/%d/%Y')
+        
+        with pytest.raises(ValueError):
+            op.apply(df)
+
+
+class TestPipeline:
+    """Tests for Pipeline composition of operations."""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """Create sample DataFrame."""
+        return pd.DataFrame({
+            'name': ['alice', 'Bob', 'bob', 'carol', 'Dave', 'alice'],
+            'city': ['NYC', 'LA', 'LA', 'NYC', 'SF', 'NYC'],
+            'age': [25, 30, 30, 41, 52, 25],
+        })
+    
+    def apply_sequentially(self, ops, df):
+        """Apply operations one by one, as callers did before Pipeline."""
+        for op in ops:
+            df = op.apply(df)
+        return df
+    
+    def test_matches_sequential_apply(self, sample_df):
+        """Test that a mixed pipeline gives the same result as applying each op."""
+        ops = [
+            FilterRows('age', '>', 26),
+            NormalizeText('name', 'lower'),
+            RemoveDuplicates(columns=['name', 'city']),
+            ReplaceValues('city', 'NYC', 'New York'),
+            MergeColumns(['name', 'city'], new_column_name='label'),
+            FilterRows('city', '!=', 'SF'),
+        ]
+        result = Pipeline(ops).apply(sample_df)
+        
+        assert result.equals(self.apply_sequentially(ops, sample_df))
+        assert result['label'].tolist() == ['bob LA', 'carol New York']
+    
+    def test_filter_on_changed_column(self, sample_df):
+        """Test that a filter sees values written by an earlier operation."""
+        ops = [
+            NormalizeText('name', 'lower'),
+            FilterRows('name', '==', 'bob'),
+        ]
+        result = Pipeline(ops).apply(sample_df)
+        
+        assert result.index.tolist() == [1, 2]
+    
+    def test_consecutive_filters(self, sample_df):
+        """Test that several filters combine into one selection."""
+        ops = [
+            FilterRows('city', '==', 'NYC'),
+            FilterRows('age', '<', 30),
+        ]
+        result = Pipeline(ops).apply(sample_df)
+        
+        assert result.index.tolist() == [0, 5]
+    
+    def test_filter_not_moved_before_auto_date_parse(self):
+        """Test that 'auto' date parsing still sees every row, as in sequential apply."""
+        df = pd.DataFrame({
+            'd': ['13/01/2024', '01/02/2024', '05/06/2024'],
+            'k': [0, 1, 1],
+        })
+        ops = [ConvertDateFormat('d'), FilterRows('k', '==', 1)]
+        result = Pipeline(ops).apply(df)
+        
+        assert result.equals(self.apply_sequentially(ops, df))
+        assert result['d'].tolist() == ['2024-02-01', '2024-06-05']
+    
+    def test_replace_dtype_matches_sequential(self):
+        """Test that a filter after ReplaceValues doesn't change the result dtype."""
+        df = pd.DataFrame({'v': [1, 2, 3], 'k': [0, 1, 1]})
+        ops = [ReplaceValues('v', 1, 'x'), FilterRows('k', '==', 1)]
+        result = Pipeline(ops).apply(df)
+        
+        assert result.equals(self.apply_sequentially(ops, df))
+        assert result['v'].dtype == object
+    
+    def test_datetime_text_matches_sequential(self):
+        """Test that text built from datetimes keeps the whole column's precision."""
+        df = pd.DataFrame({
+            'when': pd.to_datetime(['2024-01-01', '2024-01-02 10:00'], format='mixed'),
+            'k': [1, 0],
+        })
+        ops = [MergeColumns(['when', 'k'], new_column_name='label'), FilterRows('k', '==', 1)]
+        result = Pipeline(ops).apply(df)
+        
+        assert result.equals(self.apply_sequentially(ops, df))
+        assert result['label'].tolist() == ['2024-01-01 00:00:00 1']
+    
+    def test_date_parse_error_not_hidden(self):
+        """Test that a bad date removed by a later filter still raises."""
+        df = pd.DataFrame({'d': ['2024-01-01', 'garbage'], 'k': [1, 0]})
+        ops = [ConvertDateFormat('d', from_format='%Y-%m-%d'), FilterRows('k', '==', 1)]
+        
+        with pytest.raises(ValueError):
+            Pipeline(ops).apply(df)
+    
+    def test_consecutive_column_operations(self, sample_df):
+        """Test that batched column operations see each other's output."""
+        ops = [
+            NormalizeText('name', 'lower'),
+            ReplaceValues('name', 'bob', 'robert'),
+            MergeColumns(['name', 'city'], new_column_name='label'),
+            FilterRows('age', '==', 30),
+        ]
+        result = Pipeline(ops).apply(sample_df)
+        
+        assert result.equals(self.apply_sequentially(ops, sample_df))
+        assert result['label'].tolist() == ['robert LA', 'robert LA']
+    
+    def test_empty_pipeline(self, sample_df):
+        """Test that an empty pipeline returns the data unchanged."""
+        assert Pipeline([]).apply(sample_df).equals(sample_df)
+    
+    def test_original_unchanged(self, sample_df):
+        """Test that original DataFrame is not modified."""
+        original_copy = sample_df.copy()
+        Pipeline([NormalizeText('city', 'lower'), MergeColumns(['name', 'city'])]).apply(sample_df)
+        
+        assert sample_df.equals(original_copy)
+    
+    def test_missing_column_raises_key_error(self, sample_df):
+        """Test that the underlying pandas error propagates unchanged."""
+        with pytest.raises(KeyError):
+            Pipeline([NormalizeText('missing', 'lower')]).apply(sample_df)
+
+
+class TestColumnWrites:
+    """Tests that column operations write their result in a single assignment."""
+    
+    @pytest.fixture
+    def filtered_df(self):
+        """Create a DataFrame slice pandas would flag for chained assignment."""
+        df = pd.DataFrame({
+            'name': ['alice', 'Bob', 'carol'],
+            'date': ['2024-01-01', '2024-02-01', '2024-03-01'],
+            'age': [25, 30, 35],
+        })
+        return df[df['age'] > 26]
+    
+    @pytest.mark.parametrize('op', [
+        NormalizeText('name', 'upper'),
+        ReplaceValues('name', 'Bob', 'Robert'),
+        ConvertDateFormat('date'),
+        MergeColumns(['name', 'date']),
+    ])
+    def test_no_chained_assignment(self, filtered_df, op):
+        """Test that applying to a slice never triggers SettingWithCopy."""
+        with pd.option_context('mode.chained_assignment', 'raise'):
+            result = op.apply(filtered_df)
+        
+        assert len(result) == 2